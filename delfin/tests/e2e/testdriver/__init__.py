@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import random
-import datetime
 import json
 import time
 from oslo_log import log
@@ -194,12 +193,10 @@ class TestDriver(driver.StorageDriver):
 
     def _get_random_performance(self):
         def get_random_timestamp_value():
-            rtv = {}
-            for i in range(MIN_PERF_VALUES, MAX_PERF_VALUES):
-                timestamp = int(float(datetime.datetime.now().timestamp()
-                                      ) * 1000)
-                rtv[timestamp] = random.uniform(1, 100)
-            return rtv
+            # Read the clock once, the samples get distinct timestamps
+            ts0 = int(time.time() * 1000)
+            return {ts0 + i: random.uniform(1, 100)
+                    for i in range(MIN_PERF_VALUES, MAX_PERF_VALUES)}
 
         # The sample performance_params after filling looks like,
         # performance_params = {timestamp1: value1, timestamp2: value2}
@@ -0,0 +1,137 @@
+# Copyright 2020 The SODA Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from eventlet import greenthread
+
+from delfin import context
+from delfin import exception
+from delfin import test
+from delfin.drivers import fake_storage
+
+
+class TestFakeStorageDriver(test.TestCase):
+
+    def test_get_range_val(self):
+        self.assertEqual((1, 100), fake_storage.get_range_val('1-100', int))
+        self.assertEqual((0.1, 0.5),
+                         fake_storage.get_range_val('0.1-0.5', float))
+        for range_str in ('1', '1-2-3', 'a-b', None):
+            self.assertRaises(exception.InvalidInput,
+                              fake_storage.get_range_val, range_str, int)
+
+    def test_random_capacities(self):
+        capacities = fake_storage.FakeStorageDriver._random_capacities(50)
+        self.assertEqual(50, len(capacities))
+        for total, used, free in capacities:
+            self.assertTrue(1000 <= total <= 2000)
+            self.assertTrue(0 <= used <= total)
+            self.assertEqual(total, used + free)
+
+    def test_build_volumes(self):
+        driver = fake_storage.FakeStorageDriver()
+        volumes = driver._build_volumes(5, 8)
+        self.assertEqual(['volume_5', 'volume_6', 'volume_7'],
+                         [v['name'] for v in volumes])
+        for v in volumes:
+            self.assertEqual(v['name'], v['native_volume_id'])
+            self.assertEqual(v['total_capacity'],
+                             v['used_capacity'] + v['free_capacity'])
+
+    @mock.patch('delfin.drivers.fake_storage.greenthread.sleep')
+    def test_wait_random_uses_configured_range(self, mock_sleep):
+        self.override_config('fake_api_time_range', '1-1', 'fake_driver')
+        driver = fake_storage.FakeStorageDriver()
+        driver.list_storage_pools(context.get_admin_context())
+        mock_sleep.assert_called_once_with(1.0)
+
+    @mock.patch('delfin.drivers.fake_storage.greenthread.sleep')
+    def test_wait_random_disabled(self, mock_sleep):
+        self.override_config('fake_api_time_range', '0-0', 'fake_driver')
+        driver = fake_storage.FakeStorageDriver()
+        pools = driver.list_storage_pools(context.get_admin_context())
+        self.assertTrue(pools)
+        mock_sleep.assert_not_called()
+
+    @mock.patch('delfin.drivers.fake_storage.greenthread.sleep')
+    def test_ranges_are_per_driver(self, mock_sleep):
+        self.override_config('fake_api_time_range', '1-1', 'fake_driver')
+        slow_driver = fake_storage.FakeStorageDriver()
+        self.override_config('fake_api_time_range', '0-0', 'fake_driver')
+        fake_storage.FakeStorageDriver()
+        slow_driver.list_storage_pools(context.get_admin_context())
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_get_resource_perf_metrics(self):
+        self.override_config('fake_api_time_range', '0-0', 'fake_driver')
+        driver = fake_storage.FakeStorageDriver()
+        metric_list = {'iops': {'unit': 'IOPS'},
+                       'responseTime': {'unit': 'ms'}}
+        metrics = driver.get_resource_perf_metrics(
+            'fake_id', 0, 3 * fake_storage.MINIMUM_SAMPLE_DURATION_IN_MS,
+            'port', metric_list)
+        self.assertEqual(fake_storage.MAX_PORTS * len(metric_list),
+                         len(metrics))
+        self.assertEqual('iops', metrics[0].name)
+        self.assertEqual('IOPS', metrics[0].labels['unit'])
+        self.assertEqual('ms', metrics[1].labels['unit'])
+        self.assertEqual('port_0', metrics[1].labels['resource_id'])
+        self.assertEqual([0, 60000, 120000], list(metrics[0].values))
+
+    def test_volume_perf_metrics_follow_volume_range(self):
+        self.override_config('fake_api_time_range', '0-0', 'fake_driver')
+        self.override_config('fake_volume_range', '2500-2500', 'fake_driver')
+        driver = fake_storage.FakeStorageDriver()
+        ctx = context.get_admin_context()
+        metrics = driver.get_resource_perf_metrics(
+            'fake_id', 0, fake_storage.MINIMUM_SAMPLE_DURATION_IN_MS,
+            'volume', {'iops': {'unit': 'IOPS'}})
+        self.assertEqual(2500, len(metrics))
+        self.assertEqual(len(driver.list_volumes(ctx)), len(metrics))
+
+    @mock.patch('delfin.drivers.fake_storage.greenthread.sleep')
+    def test_collect_perf_metrics(self, mock_sleep):
+        driver = fake_storage.FakeStorageDriver()
+        resource_metrics = {
+            'port': {'iops': {'unit': 'IOPS'}},
+            'storage': {'iops': {'unit': 'IOPS'},
+                        'throughput': {'unit': 'MB/s'}},
+        }
+        metrics = driver.collect_perf_metrics(
+            context.get_admin_context(), 'fake_id', resource_metrics,
+            0, fake_storage.MINIMUM_SAMPLE_DURATION_IN_MS)
+        expected = ['port'] * fake_storage.MAX_PORTS + ['storage'] * 2
+        self.assertEqual(expected,
+                         [m.labels['resource_type'] for m in metrics])
+
+    def test_collect_perf_metrics_concurrently(self):
+        self.override_config('fake_api_time_range', '0-0', 'fake_driver')
+        driver = fake_storage.FakeStorageDriver()
+        threads = []
+
+        def fake_get_resource_perf_metrics(*args):
+            threads.append(greenthread.getcurrent())
+            return []
+
+        resource_metrics = {key: {'iops': {'unit': 'IOPS'}}
+                            for key in ('storage', 'port', 'controller')}
+        with mock.patch.object(driver, 'get_resource_perf_metrics',
+                               side_effect=fake_get_resource_perf_metrics):
+            driver.collect_perf_metrics(
+                context.get_admin_context(), 'fake_id', resource_metrics,
+                0, fake_storage.MINIMUM_SAMPLE_DURATION_IN_MS)
+        # Each resource type is collected in its own green thread
+        self.assertEqual(len(resource_metrics), len(set(threads)))
+        self.assertNotIn(greenthread.getcurrent(), threads)